@@ -6,22 +6,46 @@ This wrapper allows the orchestrator to be run from any directory
 
 import os
 import sys
+import signal
 import subprocess
 import argparse
+from functools import lru_cache
 from pathlib import Path
 
+# Entries that mark a directory as a project root
+PROJECT_MARKERS = frozenset({'.git', 'milestones', 'package.json', 'requirements.txt', 'pyproject.toml'})
+
+def _locate_orchestrator():
+    """Locate orchestrator.py next to this launcher"""
+    orchestrator_path = Path(__file__).parent / 'orchestrator.py'
+    
+    if not orchestrator_path.exists():
+        # Fallback to the original orchestrator.py in the same directory
+        orchestrator_path = Path(__file__).parent.resolve() / 'orchestrator.py'
+    
+    return orchestrator_path
+
+# Resolved once at import; the launcher never moves while running
+ORCHESTRATOR_PATH = _locate_orchestrator()
+
 def find_project_root():
     """Find the project root directory (containing milestones or git repo)"""
-    current = Path.cwd()
-    
-    # Check if current directory is a valid project
-    markers = ['.git', 'milestones', 'package.json', 'requirements.txt', 'pyproject.toml']
+    return _find_root(os.getcwd())
+
+@lru_cache(maxsize=32)
+def _find_root(cwd: str) -> Path:
+    """Find the project root for a working directory (cached per directory)"""
+    current = Path(cwd)
     
-    # Search up the directory tree
-    for parent in [current] + list(current.parents):
-        for marker in markers:
-            if (parent / marker).exists():
-                return parent
+    # Search up the directory tree, listing each directory once
+    # instead of stat-ing every marker separately
+    for parent in (current, *current.parents):
+        try:
+            with os.scandir(parent) as entries:
+                if any(entry.name in PROJECT_MARKERS for entry in entries):
+                    return parent
+        except OSError:
+            continue
     
     # If no project markers found, use current directory
     return current
@@ -58,11 +82,7 @@ Examples:
         project_dir = find_project_root()
     
     # Check if orchestrator.py exists in the installation directory
-    orchestrator_path = Path(__file__).parent / 'orchestrator.py'
-    
-    if not orchestrator_path.exists():
-        # Fallback to the original orchestrator.py in the same directory
-        orchestrator_path = Path(__file__).parent.resolve() / 'orchestrator.py'
+    orchestrator_path = ORCHESTRATOR_PATH
     
     if not orchestrator_path.exists():
         print(f"Error: orchestrator.py not found at {orchestrator_path}")
@@ -92,6 +112,20 @@ Examples:
     # Add any unknown arguments
     cmd.extend(unknown)
     
+    # On POSIX, replace this process with the orchestrator instead of keeping a
+    # second interpreter alive just to relay its exit code. Windows has no real
+    # exec (os.execv spawns and exits), so it keeps the child process.
+    if os.name == 'posix':
+        sys.stdout.flush()
+        sys.stderr.flush()
+        # Let Ctrl+C reach the orchestrator with default handling
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        try:
+            os.execv(sys.executable, cmd)
+        except OSError as e:
+            print(f"Error running orchestrator: {e}")
+            sys.exit(1)
+    
     # Run the orchestrator
     try:
         result = subprocess.run(cmd, check=False)
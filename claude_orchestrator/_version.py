@@ -1,27 +1,40 @@
 #!/usr/bin/env python3
 """Version information for Claude Code Orchestrator"""
 
+import sys
+
 # Version format: MAJOR.MINOR.PATCH.BUILD
 # MAJOR: Breaking changes
 # MINOR: New features, non-breaking changes  
 # PATCH: Bug fixes
 # BUILD: Build number for tracking deployments
 
-__version__ = "1.1.0.002"
-__version_info__ = (1, 1, 0, 2)
+__version__ = "1.2.0.109"
+__version_info__ = tuple(int(part) for part in __version__.split("."))
 
 # Build information
-BUILD_DATE = "2025-01-08"
-BUILD_COMMIT = "v1.1-claude"  # Version 1.1 with Claude-driven orchestration
+BUILD_DATE = "2026-10-16"
+BUILD_COMMIT = "claude-driven"  # Latest commit hash
+
+# Share one copy of each constant process-wide
+__version__ = sys.intern(__version__)
+BUILD_DATE = sys.intern(BUILD_DATE)
+BUILD_COMMIT = sys.intern(BUILD_COMMIT)
+
+# Version strings are built once at import; all inputs above are constants
+_VERSION_STRING = "Claude Code Orchestrator v" + __version__ + " (build " + BUILD_DATE + ")"
+_DETAILED_VERSION = "\n".join((
+    "Claude Code Orchestrator",
+    "Version: " + __version__,
+    "Build Date: " + BUILD_DATE,
+    "Commit: " + BUILD_COMMIT,
+    "Python Package: claude-orchestrator",
+))
 
 def get_version_string() -> str:
     """Get formatted version string"""
-    return f"Claude Code Orchestrator v{__version__} (build {BUILD_DATE})"
+    return _VERSION_STRING
 
 def get_detailed_version() -> str:
     """Get detailed version information"""
-    return f"""Claude Code Orchestrator
-Version: {__version__}
-Build Date: {BUILD_DATE}
-Commit: {BUILD_COMMIT}
-Python Package: claude-orchestrator"""
\ No newline at end of file
+    return _DETAILED_VERSION
@@ -16,10 +16,29 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 import subprocess
+import shutil
 import re
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import dataclasses
+import queue
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 import signal
+import tempfile
+import itertools
+import hashlib
+
+# orjson is optional; state persistence falls back to the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# msgpack is optional; without it the state file stays JSON
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
 
 # Import version information
 from ._version import __version__, get_version_string, get_detailed_version
@@ -38,6 +57,19 @@ from .advanced import (
 )
 from .milestone_preprocessor import MilestonePreprocessor
 
+# Milestone parsing patterns, compiled once
+_TITLE_RE = re.compile(r'^#\s+(.+)$', re.MULTILINE)
+_DESC_RE = re.compile(r'^#\s+.+?\n\n(.+?)(?=\n##|\Z)', re.MULTILINE | re.DOTALL)
+_DEPS_RE = re.compile(r'## Dependencies\n(.+?)(?=\n##|\Z)', re.MULTILINE | re.DOTALL)
+_DEP_ITEM_RE = re.compile(r'- (.+)')
+_STAGE_RE = re.compile(r'^(\d+)[a-z]?')
+_STAGE_WITH_SUFFIX_RE = re.compile(r'^(\d+)[a-z]')
+_TASK_SECTION_RE = re.compile(r'## Task (\d+): (.+?)\n(.+?)(?=\n## |\Z)', re.MULTILINE | re.DOTALL)
+_REQ_RE = re.compile(r'### Requirements\n(.+?)(?=\n###|\Z)', re.MULTILINE | re.DOTALL)
+_AC_RE = re.compile(r'### Acceptance Criteria\n(.+?)(?=\n###|\Z)', re.MULTILINE | re.DOTALL)
+_PRIO_RE = re.compile(r'Priority:\s*(High|Medium|Low)', re.IGNORECASE)
+_TIME_RE = re.compile(r'Estimated Time:\s*(\d+)')
+
 def setup_windows_console():
     """Setup console encoding for Windows to handle Unicode characters"""
     if sys.platform.startswith('win'):
@@ -51,6 +83,30 @@ def setup_windows_console():
             pass
     return True
 
+_IS_WINDOWS = sys.platform.startswith('win')
+
+# Default ASCII alternatives for console symbols
+_FALLBACK_SYMBOLS = {
+    '✅': '[OK]',
+    '❌': '[FAIL]',
+    '⚠️': '[WARN]',
+    '🔍': '[INFO]'
+}
+# Single code points are replaced in one str.translate pass; multi-code-point
+# symbols (emoji with a variation selector) still need str.replace
+_FALLBACK_TRANSLATION = str.maketrans({k: v for k, v in _FALLBACK_SYMBOLS.items() if len(k) == 1})
+_FALLBACK_SEQUENCES = tuple((k, v) for k, v in _FALLBACK_SYMBOLS.items() if len(k) > 1)
+
+def _replace_fallback_symbols(text, fallback_symbols=None):
+    """Replace Unicode symbols with their ASCII alternatives"""
+    if fallback_symbols is None:
+        for unicode_seq, ascii_alt in _FALLBACK_SEQUENCES:
+            text = text.replace(unicode_seq, ascii_alt)
+        return text.translate(_FALLBACK_TRANSLATION)
+    for unicode_char, ascii_alt in fallback_symbols.items():
+        text = text.replace(unicode_char, ascii_alt)
+    return text
+
 def safe_unicode_print(text, fallback_symbols=None):
     """
     Print text with Unicode characters, falling back to ASCII alternatives on Windows
@@ -60,23 +116,12 @@ def safe_unicode_print(text, fallback_symbols=None):
         text: The text to print
         fallback_symbols: Dict mapping Unicode chars to ASCII alternatives
     """
-    if fallback_symbols is None:
-        fallback_symbols = {
-            '✅': '[OK]',
-            '❌': '[FAIL]',
-            '⚠️': '[WARN]',
-            '🔍': '[INFO]'
-        }
-    
-    if sys.platform.startswith('win'):
+    if _IS_WINDOWS:
         try:
             print(text)
         except UnicodeEncodeError:
             # Replace Unicode characters with ASCII alternatives
-            safe_text = text
-            for unicode_char, ascii_alt in fallback_symbols.items():
-                safe_text = safe_text.replace(unicode_char, ascii_alt)
-            print(safe_text)
+            print(_replace_fallback_symbols(text, fallback_symbols))
     else:
         print(text)
 
@@ -90,28 +135,133 @@ def get_safe_unicode_string(text, fallback_symbols=None):
     Returns:
         Safe string that can be displayed on Windows console
     """
-    if fallback_symbols is None:
-        fallback_symbols = {
-            '✅': '[OK]',
-            '❌': '[FAIL]',
-            '⚠️': '[WARN]',
-            '🔍': '[INFO]'
-        }
-    
-    if sys.platform.startswith('win'):
+    if _IS_WINDOWS:
         # Always use safe alternatives on Windows for consistency
-        safe_text = text
-        for unicode_char, ascii_alt in fallback_symbols.items():
-            safe_text = safe_text.replace(unicode_char, ascii_alt)
-        return safe_text
+        return _replace_fallback_symbols(text, fallback_symbols)
     else:
         return text
 
+# Absolute git path resolved once; together with "git -C" instead of cwd= and
+# close_fds=False this lets CPython launch git via posix_spawn rather than fork+exec.
+# Descriptors are non-inheritable by default (PEP 446), so nothing extra leaks.
+_GIT_BIN = shutil.which("git") or "git"
+_GIT_CLOSE_FDS = os.name == "nt"
+
+def _run_git(*args: str, cwd: Optional[str] = None) -> subprocess.CompletedProcess:
+    """Run a git command and capture its decoded output"""
+    command = [_GIT_BIN, "-C", cwd, *args] if cwd else [_GIT_BIN, *args]
+    return subprocess.run(
+        command, close_fds=_GIT_CLOSE_FDS,
+        capture_output=True, text=True, encoding='utf-8', errors='replace'
+    )
+
+def _pin_worker_thread(cores: List[int], counter) -> None:
+    """Thread pool initializer that pins the worker thread to the next core"""
+    core = cores[next(counter) % len(cores)]
+    try:
+        # pid 0 targets the calling thread on Linux
+        os.sched_setaffinity(0, {core})
+    except OSError as e:
+        logging.warning(f"Failed to pin worker thread to CPU {core}: {e}")
+
+_HEAD_REF_PREFIX = "ref: refs/heads/"
+
+def _current_branch(cwd: str) -> str:
+    """Current branch of the repository at cwd"""
+    # Reading .git/HEAD avoids spawning git in the common case
+    try:
+        head = (Path(cwd) / ".git" / "HEAD").read_text(encoding='utf-8').strip()
+    except OSError:
+        head = ""
+    if head.startswith(_HEAD_REF_PREFIX):
+        return head[len(_HEAD_REF_PREFIX):]
+    
+    # Detached HEAD, linked worktree or subdirectory: ask git
+    result = _run_git("branch", "--show-current", cwd=cwd)
+    result.check_returncode()
+    return result.stdout.strip()
+
+_LEGACY_STATE_FILE = ".orchestrator/orchestrator_state.json"
+_DEFAULT_STATE_FILE = ".orchestrator/orchestrator_state.msgpack" if msgpack is not None else _LEGACY_STATE_FILE
+# Upper bound on execution log entries held in memory
+_EXECUTION_LOG_MAXLEN = 10000
+# The journal is rotated to <journal>.1 when a run first writes to it past this size
+_JOURNAL_MAX_BYTES = 10 * 1024 * 1024
+_MILESTONE_CACHE_FILE = (".orchestrator/milestone_cache.msgpack" if msgpack is not None
+                         else ".orchestrator/milestone_cache.json")
+
+# Background TASKS.md writer: entries drained per batch and minimum gap between appends
+_TASKS_FILE_BATCH_SIZE = 64
+_TASKS_FILE_FLUSH_INTERVAL = 0.25
+
+def _is_msgpack_path(path: str) -> bool:
+    return path.endswith(".msgpack")
+
+def _normalize_state(value):
+    """Reduce state to plain JSON types so every backend stores exactly the same data"""
+    if isinstance(value, dict):
+        # JSON object keys are strings, so int stage numbers are stored as strings everywhere
+        return {str(key): _normalize_state(item) for key, item in value.items()}
+    if isinstance(value, (set, frozenset)):
+        return sorted((_normalize_state(item) for item in value), key=str)
+    if isinstance(value, (list, tuple, deque)):
+        return [_normalize_state(item) for item in value]
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return _normalize_state(dataclasses.asdict(value))
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+def _dump_state_bytes(data: Dict, path: str) -> bytes:
+    """Serialize state for the given file, as MessagePack or indented JSON"""
+    data = _normalize_state(data)
+    if _is_msgpack_path(path):
+        return msgpack.packb(data, use_bin_type=True)
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+def _load_state_bytes(raw: bytes, path: str) -> Dict:
+    """Parse state read from the given file, as MessagePack or JSON"""
+    if _is_msgpack_path(path):
+        return msgpack.unpackb(raw, raw=False, strict_map_key=False)
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def _atomic_write_bytes(path: str, payload: bytes) -> None:
+    """Write payload to path via a synced sibling temp file and os.replace"""
+    # A crash mid-write never leaves a truncated file behind
+    f = tempfile.NamedTemporaryFile('wb', dir=os.path.dirname(path) or ".", prefix=".state-", delete=False)
+    try:
+        with f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(f.name, path)
+    except BaseException:
+        try:
+            os.unlink(f.name)
+        except OSError:
+            pass
+        raise
+
 class OrchestratorState:
     """Manages orchestrator state and persistence"""
     
-    def __init__(self, state_file: str = ".orchestrator/orchestrator_state.json"):
+    def __init__(self, state_file: str = _DEFAULT_STATE_FILE):
         self.state_file = state_file
+        # Same state in the other format, left behind when msgpack was installed
+        # or removed since the last run; migrated into state_file on the next save
+        base, ext = os.path.splitext(state_file)
+        self.alternate_state_file = {".msgpack": base + ".json", ".json": base + ".msgpack"}.get(ext)
+        self._drop_alternate = False
+        # New log entries go to an append-only journal; "execution_log" only
+        # keeps entries carried over from older state files
+        self.journal_file = os.path.join(os.path.dirname(state_file), "execution.jsonl")
+        self._journal = None
+        # Digest of the bytes currently on disk, used to skip unchanged saves
+        self._saved_digest = None
         self.state = {
             "current_stage": 0,
             "completed_tasks": set(),
@@ -122,20 +272,36 @@ class OrchestratorState:
             "total_start_time": None,
             "rate_limit_resets": {},
             "worktree_paths": {},
-            "execution_log": []
+            "execution_log": deque(maxlen=_EXECUTION_LOG_MAXLEN)
         }
         self.load_state()
     
     def load_state(self):
         """Load state from file"""
-        if os.path.exists(self.state_file):
+        candidates = [path for path in (self.state_file, self.alternate_state_file)
+                      if path and os.path.exists(path)]
+        if msgpack is None and any(_is_msgpack_path(path) for path in candidates):
+            logging.warning("Ignoring MessagePack state file because msgpack is not installed")
+            candidates = [path for path in candidates if not _is_msgpack_path(path)]
+        # Resume from whichever format was written last
+        state_path = max(candidates, key=os.path.getmtime) if candidates else None
+        self._drop_alternate = self.alternate_state_file in candidates
+        if state_path is not None:
+            if state_path != self.state_file:
+                logging.info(f"Loading state from {state_path}, will migrate it to {self.state_file}")
             try:
-                with open(self.state_file, 'r') as f:
-                    data = json.load(f)
+                with open(state_path, 'rb') as f:
+                    raw = f.read()
+                    data = _load_state_bytes(raw, state_path)
+                    if state_path == self.state_file:
+                        self._saved_digest = hashlib.sha1(raw).digest()
                     # Convert sets from lists
                     for key in ["completed_tasks", "failed_tasks", "skipped_tasks"]:
                         if key in data:
                             data[key] = set(data[key])
+                    # Keep only the most recent carried-over log entries
+                    if "execution_log" in data:
+                        data["execution_log"] = deque(data["execution_log"], maxlen=_EXECUTION_LOG_MAXLEN)
                     self.state.update(data)
             except Exception as e:
                 logging.error(f"Failed to load state: {e}")
@@ -143,21 +309,67 @@ class OrchestratorState:
     def save_state(self):
         """Save state to file"""
         try:
-            data = self.state.copy()
-            # Convert sets to lists for JSON serialization
-            for key in ["completed_tasks", "failed_tasks", "skipped_tasks"]:
-                if key in data:
-                    data[key] = list(data[key])
-            
-            with open(self.state_file, 'w') as f:
-                json.dump(data, f, indent=2, default=str)
+            # Sets and the log ring buffer are converted to lists while normalizing
+            payload = _dump_state_bytes(self.state, self.state_file)
+            digest = hashlib.sha1(payload).digest()
+            if digest != self._saved_digest or not os.path.exists(self.state_file):
+                _atomic_write_bytes(self.state_file, payload)
+                self._saved_digest = digest
+            if self._drop_alternate:
+                # state_file now holds the newest state; the other format would only go stale
+                self._drop_alternate = False
+                if os.path.exists(self.alternate_state_file):
+                    os.remove(self.alternate_state_file)
         except Exception as e:
             logging.error(f"Failed to save state: {e}")
     
     def add_log_entry(self, entry: str):
-        """Add entry to execution log"""
+        """Append entry to the execution log journal"""
         timestamp = datetime.now().isoformat()
-        self.state["execution_log"].append(f"[{timestamp}] {entry}")
+        record = {"ts": timestamp, "msg": entry}
+        line = orjson.dumps(record).decode('utf-8') if orjson is not None else json.dumps(record)
+        try:
+            if self._journal is None:
+                os.makedirs(os.path.dirname(self.journal_file) or ".", exist_ok=True)
+                # Rotate once per run so the journal doesn't grow across runs forever
+                size = os.path.getsize(self.journal_file) if os.path.exists(self.journal_file) else 0
+                if size > _JOURNAL_MAX_BYTES:
+                    os.replace(self.journal_file, self.journal_file + ".1")
+                    size = 0
+                self._journal = open(self.journal_file, 'a', buffering=1, encoding='utf-8')
+                if size:
+                    # Terminate a line left partial by a crash so it doesn't swallow this entry
+                    with open(self.journal_file, 'rb') as f:
+                        f.seek(-1, os.SEEK_END)
+                        if f.read(1) != b"\n":
+                            self._journal.write("\n")
+            self._journal.write(line + "\n")
+        except OSError as e:
+            logging.error(f"Failed to write execution log entry: {e}")
+    
+    def read_execution_log(self, limit: Optional[int] = None) -> List[str]:
+        """Return execution log entries (optionally only the last `limit`)"""
+        entries = list(self.state.get("execution_log", ()))
+        if os.path.exists(self.journal_file):
+            with open(self.journal_file, 'r', encoding='utf-8') as f:
+                lines = deque(f, maxlen=limit) if limit else f
+                for line in lines:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        record = json.loads(line)
+                        entries.append(f"[{record['ts']}] {record['msg']}")
+                    except (ValueError, KeyError, TypeError):
+                        # A crash mid-write can leave a truncated last line
+                        logging.warning(f"Skipping unreadable execution log line: {line[:80]}")
+        return entries[-limit:] if limit else entries
+    
+    def close_journal(self):
+        """Flush and close the execution log journal"""
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
     
     def reset_state(self):
         """Reset state to initial values"""
@@ -171,11 +383,15 @@ class OrchestratorState:
             "total_start_time": None,
             "rate_limit_resets": {},
             "worktree_paths": {},
-            "execution_log": []
+            "execution_log": deque(maxlen=_EXECUTION_LOG_MAXLEN)
         }
-        # Remove state file if it exists
-        if os.path.exists(self.state_file):
-            os.remove(self.state_file)
+        self.close_journal()
+        self._saved_digest = None
+        # Remove state files and the log journal if they exist
+        for state_path in (self.state_file, self.alternate_state_file,
+                           self.journal_file, self.journal_file + ".1"):
+            if state_path and os.path.exists(state_path):
+                os.remove(state_path)
         logging.info("Orchestrator state has been reset")
 
 # TaskResult is now imported from types_shared
@@ -211,12 +427,26 @@ class MilestoneOrchestrator:
         
         # Shutdown handling
         self.shutdown_requested = False
+        self._force_exit_timer = None
+        # Set on shutdown so retry and resource waits wake immediately
+        self._shutdown_event = threading.Event()
         signal.signal(signal.SIGINT, self.signal_handler)
         signal.signal(signal.SIGTERM, self.signal_handler)
         
         # Task execution
-        self.max_workers = self.config.get("execution", {}).get("max_parallel_tasks", 4)
-        self.executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        self.max_workers = self._resolve_max_workers()
+        executor_kwargs = {}
+        if self.config.get("execution", {}).get("pin_threads", False) and hasattr(os, "sched_setaffinity"):
+            # Opt-in: pin each worker to its own core, round-robin over the allowed set
+            cores = sorted(os.sched_getaffinity(0))
+            executor_kwargs = {"initializer": _pin_worker_thread, "initargs": (cores, itertools.count())}
+        # I/O-bound milestone execution (claude CLI, git) runs on self.executor
+        self.executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="orch-io",
+                                           **executor_kwargs)
+        # TASKS.md updates are appended by a lazily started background writer
+        self._tasks_file_queue = queue.Queue()
+        self._tasks_file_lock = threading.Lock()
+        self._tasks_file_writer = None
         
         # Output control
         self.verbose = False
@@ -225,10 +455,23 @@ class MilestoneOrchestrator:
         
         logging.info("Orchestrator initialized successfully")
     
+    def _resolve_max_workers(self) -> int:
+        """Worker count for this process: ORCHESTRATOR_MAX_WORKERS, then config, then CPU-based default"""
+        default = min(32, (os.cpu_count() or 4) * 2)
+        configured = self.config.get("execution", {}).get("max_parallel_tasks", default)
+        env_value = os.environ.get("ORCHESTRATOR_MAX_WORKERS")
+        if env_value:
+            try:
+                configured = int(env_value)
+            except ValueError:
+                logging.warning(f"Ignoring invalid ORCHESTRATOR_MAX_WORKERS value: {env_value}")
+        return max(1, configured)
+    
     def signal_handler(self, signum, frame):
         """Handle shutdown signals gracefully"""
         logging.info(f"Received signal {signum}, initiating graceful shutdown...")
         self.shutdown_requested = True
+        self._shutdown_event.set()
         self.state.add_log_entry(f"Shutdown signal received: {signum}")
         
         # Shutdown the thread pool executor to cancel running tasks
@@ -236,27 +479,23 @@ class MilestoneOrchestrator:
             logging.info("Shutting down thread pool executor...")
             self.executor.shutdown(wait=False, cancel_futures=True)
             
-        # Force exit after a short delay if graceful shutdown doesn't work
-        import threading
-        def force_exit():
-            import time
-            time.sleep(2)  # Give graceful shutdown a chance
-            if self.shutdown_requested:
-                logging.warning("Forcing exit due to shutdown timeout")
-                os._exit(130)  # Exit code for SIGINT
-        
-        force_exit_thread = threading.Thread(target=force_exit, daemon=True)
-        force_exit_thread.start()
+        # Force exit after a short delay if graceful shutdown doesn't work;
+        # repeated signals reuse the timer armed by the first one
+        if self._force_exit_timer is None:
+            self._force_exit_timer = threading.Timer(2.0, self._force_exit)
+            self._force_exit_timer.daemon = True
+            self._force_exit_timer.start()
+    
+    def _force_exit(self):
+        """Exit immediately if a requested shutdown has not completed"""
+        if self.shutdown_requested:
+            logging.warning("Forcing exit due to shutdown timeout")
+            os._exit(130)  # Exit code for SIGINT
     
     def get_current_branch(self) -> str:
         """Get the current git branch"""
         try:
-            result = subprocess.run(
-                ["git", "branch", "--show-current"],
-                capture_output=True, text=True, check=True,
-                encoding='utf-8', errors='replace'
-            )
-            return result.stdout.strip()
+            return _current_branch(os.getcwd())
         except subprocess.CalledProcessError:
             logging.warning("Failed to get current branch, falling back to 'main'")
             return "main"
@@ -361,11 +600,15 @@ class MilestoneOrchestrator:
         if not milestones_dir.exists():
             raise FileNotFoundError(f"Milestones directory not found: {milestones_dir}")
         
+        # Per-entry listings are only worth building when debug logging is on
+        debug_enabled = logging.getLogger().isEnabledFor(logging.DEBUG)
+        
         # Log all files in the directory for debugging
-        all_files = list(milestones_dir.iterdir())
-        logging.info(f"📁 Found {len(all_files)} files/directories in {milestones_dir}:")
-        for file_path in all_files:
-            logging.info(f"  - {file_path.name} ({'file' if file_path.is_file() else 'directory'})")
+        if debug_enabled:
+            all_files = list(milestones_dir.iterdir())
+            logging.debug(f"📁 Found {len(all_files)} files/directories in {milestones_dir}:")
+            for file_path in all_files:
+                logging.debug(f"  - {file_path.name} ({'file' if file_path.is_file() else 'directory'})")
         
         # Find all .md files, excluding README.md
         all_md_files = list(milestones_dir.glob("*.md"))
@@ -377,22 +620,41 @@ class MilestoneOrchestrator:
         else:
             logging.info(f"📄 Found {len(md_files)} .md files:")
         
-        for md_file in md_files:
-            logging.info(f"  - {md_file.name}")
+        if debug_enabled:
+            for md_file in md_files:
+                logging.debug(f"  - {md_file.name}")
         
         milestones = []
+        # Reuse parses of files whose mtime and size are unchanged and parse the
+        # rest inline; parsing is pure-Python regex work, so threads wouldn't help
+        cache = self._load_milestone_cache()
+        new_cache = {}
         for milestone_file in md_files:
-            logging.info(f"🔍 Processing milestone file: {milestone_file.name}")
+            logging.debug(f"🔍 Processing milestone file: {milestone_file.name}")
             try:
-                milestone = self.parse_milestone_file(milestone_file)
+                st = milestone_file.stat()
+                stamp = [st.st_mtime_ns, st.st_size]
+            except OSError:
+                stamp = None
+            try:
+                entry = cache.get(str(milestone_file))
+                if stamp is not None and entry is not None and entry[0] == stamp:
+                    milestone = entry[1]
+                else:
+                    milestone = self.parse_milestone_file(milestone_file)
                 if milestone:
                     logging.info(f"✅ Successfully parsed milestone: {milestone['id']} (stage {milestone.get('stage', 'unknown')})")
                     milestones.append(milestone)
+                    if stamp is not None:
+                        new_cache[str(milestone_file)] = [stamp, milestone]
                 else:
                     logging.warning(f"⚠️  Failed to parse milestone file (returned None): {milestone_file.name}")
             except Exception as e:
                 logging.error(f"❌ Failed to parse milestone {milestone_file}: {e}")
         
+        if new_cache != cache:
+            self._save_milestone_cache(new_cache)
+        
         # Sort by milestone ID
         milestones.sort(key=lambda x: x["id"])
         logging.info(f"📊 Discovery complete: {len(milestones)} milestones discovered")
@@ -405,33 +667,53 @@ class MilestoneOrchestrator:
         
         return milestones
     
+    def _load_milestone_cache(self) -> Dict:
+        """Load parsed milestones keyed by file path, or {} if unavailable"""
+        try:
+            with open(_MILESTONE_CACHE_FILE, 'rb') as f:
+                cache = _load_state_bytes(f.read(), _MILESTONE_CACHE_FILE)
+            return cache if isinstance(cache, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logging.warning(f"Ignoring unreadable milestone cache: {e}")
+            return {}
+    
+    def _save_milestone_cache(self, cache: Dict):
+        """Persist parsed milestones for the next discovery"""
+        try:
+            os.makedirs(os.path.dirname(_MILESTONE_CACHE_FILE), exist_ok=True)
+            _atomic_write_bytes(_MILESTONE_CACHE_FILE, _dump_state_bytes(cache, _MILESTONE_CACHE_FILE))
+        except Exception as e:
+            logging.warning(f"Failed to save milestone cache: {e}")
+    
     def parse_milestone_file(self, filepath: Path) -> Optional[Dict]:
         """Parse a milestone file and create a single task for Claude Code to handle"""
         try:
-            # Read the raw milestone content
-            original_content = filepath.read_text(encoding='utf-8')
+            # Read the raw milestone content and decode it once
+            original_content = filepath.read_bytes().decode('utf-8', 'replace')
             milestone_id = filepath.stem
             
             # Extract basic metadata from the raw content
-            title_match = re.search(r'^#\s+(.+)$', original_content, re.MULTILINE)
+            title_match = _TITLE_RE.search(original_content)
             title = title_match.group(1) if title_match else milestone_id
             
             # Extract description (everything after title until first ##)
-            desc_match = re.search(r'^#\s+.+?\n\n(.+?)(?=\n##|\Z)', original_content, re.MULTILINE | re.DOTALL)
+            desc_match = _DESC_RE.search(original_content)
             description = desc_match.group(1).strip() if desc_match else ""
             
             # Extract dependencies
-            deps_match = re.search(r'## Dependencies\n(.+?)(?=\n##|\Z)', original_content, re.MULTILINE | re.DOTALL)
+            deps_match = _DEPS_RE.search(original_content)
             dependencies = []
             if deps_match:
                 deps_text = deps_match.group(1)
                 if "None specified" not in deps_text:
-                    dependencies = re.findall(r'- (.+)', deps_text)
+                    dependencies = _DEP_ITEM_RE.findall(deps_text)
             
             # Extract stage information from milestone ID (e.g., "1a" -> stage 1)
             stage = 1
             if milestone_id:
-                id_stage_match = re.search(r'^(\d+)[a-z]?', milestone_id)
+                id_stage_match = _STAGE_RE.match(milestone_id)
                 if id_stage_match:
                     stage = int(id_stage_match.group(1))
                     logging.info(f"🔍 Detected stage {stage} from milestone ID: {milestone_id}")
@@ -471,28 +753,25 @@ class MilestoneOrchestrator:
         tasks = []
         
         # Find task sections
-        task_sections = re.findall(r'## Task (\d+): (.+?)\n(.+?)(?=\n## |\Z)', 
-                                 content, re.MULTILINE | re.DOTALL)
+        task_sections = _TASK_SECTION_RE.findall(content)
         
         for task_num, task_title, task_content in task_sections:
             task_id = f"{milestone_id}-T{task_num}"
             
             # Extract requirements
-            req_match = re.search(r'### Requirements\n(.+?)(?=\n###|\Z)', 
-                                task_content, re.MULTILINE | re.DOTALL)
+            req_match = _REQ_RE.search(task_content)
             requirements = req_match.group(1).strip() if req_match else ""
             
             # Extract acceptance criteria
-            ac_match = re.search(r'### Acceptance Criteria\n(.+?)(?=\n###|\Z)', 
-                               task_content, re.MULTILINE | re.DOTALL)
+            ac_match = _AC_RE.search(task_content)
             acceptance_criteria = ac_match.group(1).strip() if ac_match else ""
             
             # Extract priority
-            priority_match = re.search(r'Priority:\s*(High|Medium|Low)', task_content, re.IGNORECASE)
+            priority_match = _PRIO_RE.search(task_content)
             priority = priority_match.group(1).lower() if priority_match else "medium"
             
             # Extract estimated time
-            time_match = re.search(r'Estimated Time:\s*(\d+)', task_content)
+            time_match = _TIME_RE.search(task_content)
             estimated_time = int(time_match.group(1)) if time_match else 30
             
             tasks.append({
@@ -605,60 +884,62 @@ class MilestoneOrchestrator:
         
         stage_start_time = time.time()
         stage_results = []
+        successful_milestones = 0
         
         # Prepare worktrees for parallel execution
         if self.config["git"]["use_worktrees"]:
             self.prepare_stage_worktrees(stage_num, milestones)
         
-        # Execute milestones in parallel within the stage
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            future_to_milestone = {
-                executor.submit(self.execute_milestone, milestone, stage_num): milestone
-                for milestone in milestones
-            }
-            
-            # Use timeout to allow checking shutdown_requested more frequently
-            while future_to_milestone and not self.shutdown_requested:
+        # Execute milestones in parallel within the stage, reusing the
+        # orchestrator-wide pool (shut down in cleanup) across stages
+        executor = self.executor
+        future_to_milestone = {
+            executor.submit(self.execute_milestone, milestone, stage_num): milestone
+            for milestone in milestones
+        }
+        
+        # Wait with a timeout so shutdown_requested is checked regularly; each
+        # pass registers waiters only on the futures that are still pending
+        pending = set(future_to_milestone)
+        while pending:
+            if self.shutdown_requested:
+                # Cancel remaining futures, then join milestones that were already
+                # running so nothing is recorded while worktrees are still changing
+                for remaining_future in pending:
+                    remaining_future.cancel()
+                wait(pending)
+                break
+            
+            done, pending = wait(pending, timeout=1.0, return_when=FIRST_COMPLETED)
+            for future in done:
+                milestone = future_to_milestone.pop(future)
                 try:
-                    for future in as_completed(future_to_milestone, timeout=1.0):
-                        if self.shutdown_requested:
-                            # Cancel remaining futures
-                            for remaining_future in future_to_milestone:
-                                remaining_future.cancel()
-                            break
-                        
-                        milestone = future_to_milestone.pop(future)
-                        try:
-                            result = future.result()
-                            stage_results.append(result)
-                            
-                            if result["success"]:
-                                print(f"    [DONE] Milestone completed: {milestone['title']}")
-                                logging.info(f"Milestone {milestone['id']} completed successfully")
-                                if self.verbose:
-                                    duration = result.get('duration', 0)
-                                    task_count = len(result.get('task_results', []))
-                                    print(f"           Duration: {duration:.1f}s, Tasks: {task_count}")
-                            else:
-                                error_msg = result.get('error', 'Unknown error')
-                                print(f"    [FAIL] Milestone failed: {milestone['title']} - {error_msg}")
-                                logging.error(f"Milestone {milestone['id']} failed: {error_msg}")
-                        
-                        except Exception as e:
-                            logging.error(f"Milestone {milestone['id']} execution exception: {e}")
-                            stage_results.append({
-                                "milestone_id": milestone["id"],
-                                "success": False,
-                                "error": str(e)
-                            })
-                        break  # Process one future at a time
-                except TimeoutError:
-                    # Timeout allows us to check shutdown_requested
-                    continue
+                    result = future.result()
+                    stage_results.append(result)
+                    
+                    if result["success"]:
+                        successful_milestones += 1
+                        print(f"    [DONE] Milestone completed: {milestone['title']}")
+                        logging.info(f"Milestone {milestone['id']} completed successfully")
+                        if self.verbose:
+                            duration = result.get('duration', 0)
+                            task_count = len(result.get('task_results', []))
+                            print(f"           Duration: {duration:.1f}s, Tasks: {task_count}")
+                    else:
+                        error_msg = result.get('error', 'Unknown error')
+                        print(f"    [FAIL] Milestone failed: {milestone['title']} - {error_msg}")
+                        logging.error(f"Milestone {milestone['id']} failed: {error_msg}")
+                
+                except Exception as e:
+                    logging.error(f"Milestone {milestone['id']} execution exception: {e}")
+                    stage_results.append({
+                        "milestone_id": milestone["id"],
+                        "success": False,
+                        "error": str(e)
+                    })
         
         # Analyze stage results
         stage_duration = time.time() - stage_start_time
-        successful_milestones = sum(1 for result in stage_results if result["success"])
         
         self.state.state["stage_results"][stage_num] = {
             "duration": stage_duration,
@@ -702,20 +983,22 @@ class MilestoneOrchestrator:
     
     def prepare_stage_worktrees(self, stage_num: int, milestones: List[Dict]):
         """Prepare git worktrees for stage execution"""
+        # Resolve config and state lookups once for the whole stage
+        git_config = self.config.get("git", {})
+        base_branch = git_config.get("base_branch", "main")
+        prefix = git_config.get("worktree_prefix", "milestone-")
+        worktree_paths = self.state.state["worktree_paths"]
+        
         for milestone in milestones:
             try:
-                worktree_path = self.worktree_manager.create_worktree(
-                    milestone["id"], 
-                    self.config["git"]["base_branch"],
-                    prefix=self.config["git"]["worktree_prefix"]
-                )
-                self.state.state["worktree_paths"][milestone["id"]] = worktree_path
+                worktree_path = self.worktree_manager.create_worktree(milestone["id"], base_branch, prefix=prefix)
+                worktree_paths[milestone["id"]] = worktree_path
                 logging.debug(f"Created worktree for {milestone['id']}: {worktree_path}")
             except Exception as e:
                 logging.warning(f"Failed to create worktree for {milestone['id']}: {e}")
     
     def merge_stage_worktrees(self, stage_num: int, milestones: List[Dict]) -> bool:
-        """Merge worktrees sequentially into the root branch"""
+        """Merge stage worktrees into the root branch, in one octopus merge when possible"""
         logging.info(f"Merging worktrees for stage {stage_num}")
         
         if self.verbose:
@@ -723,38 +1006,71 @@ class MilestoneOrchestrator:
         
         successful_merges = 0
         
+        # Switch to the base branch once; every merge below happens on it
+        base_branch = self.config.get("git", {}).get("base_branch", "main")
+        checkout_result = _run_git("checkout", base_branch)
+        if checkout_result.returncode != 0:
+            logging.error(f"Failed to checkout base branch {base_branch}: {checkout_result.stderr}")
+            return not milestones
+        
+        # Resolve the feature branch of every milestone
+        candidates = []
+        worktree_paths = self.state.state.get("worktree_paths", {})
         for milestone in milestones:
             milestone_id = milestone["id"]
-            worktree_path = self.state.state.get("worktree_paths", {}).get(milestone_id)
-            
-            if not worktree_path:
+            if not worktree_paths.get(milestone_id):
                 logging.warning(f"No worktree path found for milestone {milestone_id}")
                 continue
             
+            worktree_info = self.worktree_manager.get_worktree(milestone_id)
+            if not worktree_info:
+                logging.warning(f"No worktree info found for {milestone_id}")
+                continue
+            
+            candidates.append((milestone, worktree_info.branch))
+        
+        # Check each branch against the base in parallel with merge-tree, which
+        # never touches the working tree; exit code 0 means it merges cleanly
+        clean = []
+        if len(candidates) > 1:
+            with ThreadPoolExecutor(max_workers=min(len(candidates), self.max_workers)) as pool:
+                checks = list(pool.map(
+                    lambda candidate: _run_git("merge-tree", "--write-tree", base_branch, candidate[1]),
+                    candidates
+                ))
+            clean = [candidate for candidate, check in zip(candidates, checks) if check.returncode == 0]
+        
+        # Merge all cleanly merging branches at once; fall back to one merge per
+        # branch if that fails (e.g. branches conflicting with each other)
+        merged_ids = set()
+        if len(clean) > 1:
+            clean_ids = [milestone["id"] for milestone, _ in clean]
+            octopus_result = _run_git(
+                "merge", "--no-ff", *(branch for _, branch in clean),
+                "-m", f"Merge stage {stage_num} milestones: {', '.join(clean_ids)}"
+            )
+            if octopus_result.returncode == 0:
+                merged_ids.update(clean_ids)
+                successful_merges += len(clean)
+                for milestone, _ in clean:
+                    logging.info(f"Successfully merged {milestone['id']}")
+                    if self.verbose:
+                        print(f"    [MERGED] {milestone['id']}: {milestone['title']}")
+            else:
+                logging.warning(f"Octopus merge for stage {stage_num} failed, merging branches one by one")
+                _run_git("merge", "--abort")
+        
+        for milestone, branch_name in candidates:
+            milestone_id = milestone["id"]
+            if milestone_id in merged_ids:
+                continue
+            
             try:
-                # Get the branch name for this worktree
-                worktree_info = self.worktree_manager.get_worktree_info(milestone_id)
-                if not worktree_info:
-                    logging.warning(f"No worktree info found for {milestone_id}")
-                    continue
-                
-                branch_name = worktree_info["branch"]
-                
-                # Switch to base branch and merge the feature branch
-                base_branch = self.config["git"]["base_branch"]
-                
-                merge_result = subprocess.run([
-                    "git", "checkout", base_branch
-                ], capture_output=True, text=True, encoding='utf-8', errors='replace')
-                
-                if merge_result.returncode != 0:
-                    logging.error(f"Failed to checkout base branch {base_branch}: {merge_result.stderr}")
-                    continue
-                
-                merge_result = subprocess.run([
-                    "git", "merge", "--no-ff", branch_name, 
+                # Merge the feature branch into the base branch
+                merge_result = _run_git(
+                    "merge", "--no-ff", branch_name,
                     "-m", f"Merge milestone {milestone_id}: {milestone['title']}"
-                ], capture_output=True, text=True, encoding='utf-8', errors='replace')
+                )
                 
                 if merge_result.returncode == 0:
                     successful_merges += 1
@@ -766,6 +1082,8 @@ class MilestoneOrchestrator:
                     logging.error(f"Failed to merge {milestone_id}: {merge_result.stderr}")
                     if self.verbose:
                         print(f"    [MERGE_FAIL] {milestone_id}: {merge_result.stderr[:100]}")
+                    # Leave the base branch clean for the remaining merges
+                    _run_git("merge", "--abort")
             
             except Exception as e:
                 logging.error(f"Exception during merge of {milestone_id}: {e}")
@@ -829,58 +1147,54 @@ class MilestoneOrchestrator:
             print(f"  → Committing complete stage {stage_num} to root branch...")
         
         try:
-            # Check if there are any changes to commit
-            status_result = subprocess.run([
-                "git", "status", "--porcelain"
-            ], capture_output=True, text=True, encoding='utf-8', errors='replace')
-            
-            if not status_result.stdout.strip():
-                logging.info(f"No changes to commit for stage {stage_num}")
-                return True
-            
-            # Add all changes
-            add_result = subprocess.run([
-                "git", "add", "."
-            ], capture_output=True, text=True, encoding='utf-8', errors='replace')
+            # Add all changes; the commit below reports whether anything was staged,
+            # so no separate status probe is needed
+            add_result = _run_git("add", ".")
             
             if add_result.returncode != 0:
                 logging.error(f"Failed to add changes for stage {stage_num}: {add_result.stderr}")
                 return False
             
-            # Create comprehensive commit message
-            commit_message = f"Complete Stage {stage_num}: {len(milestones)} milestones integrated\n\n"
-            
-            commit_message += "Milestones completed in this stage:\n"
+            # Create comprehensive commit message (collected in a list, joined once)
+            parts = [
+                f"Complete Stage {stage_num}: {len(milestones)} milestones integrated\n\n",
+                "Milestones completed in this stage:\n",
+            ]
             for milestone in milestones:
-                commit_message += f"- {milestone['id']}: {milestone['title']}\n"
+                parts.append(f"- {milestone['id']}: {milestone['title']}\n")
                 tasks = milestone.get('tasks', [])
                 if tasks:
-                    for task in tasks[:3]:  # Show first 3 tasks
-                        commit_message += f"  • {task.get('title', task.get('id', 'Task'))}\n"
+                    # Show first 3 tasks
+                    parts.extend(f"  • {task.get('title', task.get('id', 'Task'))}\n" for task in tasks[:3])
                     if len(tasks) > 3:
-                        commit_message += f"  • ... and {len(tasks) - 3} more tasks\n"
-            
-            commit_message += "\n"
-            commit_message += "Stage completed with:\n"
-            commit_message += "- Individual milestone worktrees merged\n"
-            commit_message += "- Comprehensive code review conducted\n" 
-            commit_message += "- Quality gates validated\n"
-            commit_message += "- All changes integrated to main branch\n\n"
-            
-            commit_message += f"Stage {stage_num} represents a significant milestone in the project development.\n\n"
-            commit_message += "🤖 Generated with [Claude Code](https://claude.ai/code)\n\n"
-            commit_message += "Co-Authored-By: Claude <noreply@anthropic.com>"
+                        parts.append(f"  • ... and {len(tasks) - 3} more tasks\n")
+            
+            parts.append(
+                "\n"
+                "Stage completed with:\n"
+                "- Individual milestone worktrees merged\n"
+                "- Comprehensive code review conducted\n"
+                "- Quality gates validated\n"
+                "- All changes integrated to main branch\n\n"
+            )
+            parts.append(f"Stage {stage_num} represents a significant milestone in the project development.\n\n")
+            parts.append(
+                "🤖 Generated with [Claude Code](https://claude.ai/code)\n\n"
+                "Co-Authored-By: Claude <noreply@anthropic.com>"
+            )
+            commit_message = "".join(parts)
             
             # Commit the stage
-            commit_result = subprocess.run([
-                "git", "commit", "-m", commit_message
-            ], capture_output=True, text=True, encoding='utf-8', errors='replace')
+            commit_result = _run_git("commit", "-m", commit_message)
             
             if commit_result.returncode == 0:
                 logging.info(f"Successfully committed stage {stage_num} completion")
                 if self.verbose:
                     print(f"  [STAGE_COMMITTED] Stage {stage_num}")
                 return True
+            elif _run_git("diff", "--cached", "--quiet").returncode == 0:
+                logging.info(f"No changes to commit for stage {stage_num}")
+                return True
             else:
                 logging.error(f"Failed to commit stage {stage_num}: {commit_result.stderr}")
                 if self.verbose:
@@ -921,6 +1235,7 @@ class MilestoneOrchestrator:
             
             # Group tasks by priority for execution order
             high_priority_tasks = [t for t in tasks if t.get("priority", "medium") == "high"]
+            high_priority_ids = frozenset(t["id"] for t in high_priority_tasks)
             other_tasks = [t for t in tasks if t.get("priority", "medium") != "high"]
             
             # Execute high priority tasks first, then others
@@ -932,7 +1247,7 @@ class MilestoneOrchestrator:
                 results.extend(group_results)
                 
                 # Check if any critical tasks failed
-                critical_failures = [r for r in group_results if not r.success and r.task_id in [t["id"] for t in high_priority_tasks]]
+                critical_failures = [r for r in group_results if not r.success and r.task_id in high_priority_ids]
                 if critical_failures:
                     logging.error(f"Critical tasks failed in {milestone_id}")
                     break
@@ -998,14 +1313,14 @@ class MilestoneOrchestrator:
             # Step 1: Pre-review milestone validation with Claude Code
             milestone_validation = self._conduct_pre_review_validation(milestone_id, milestone, worktree_path)
             
-            if not milestone_validation.success:
+            if not milestone_validation.valid:
                 if self.verbose:
-                    print(f"      [MILESTONE_VALIDATION] Failed: {milestone_validation.error}")
+                    print(f"      [MILESTONE_VALIDATION] Failed: {'; '.join(milestone_validation.errors)}")
                 
                 # Execute gap fixing if validation fails
                 gap_fix_result = self._execute_stage_milestone_gap_fix(
                     milestone_id, 
-                    milestone_validation.error, 
+                    '; '.join(milestone_validation.errors), 
                     worktree_path
                 )
                 
@@ -1014,7 +1329,7 @@ class MilestoneOrchestrator:
                         success=False,
                         quality_score=0.0,
                         todos_found=[],
-                        quality_gates_failed=[f"Milestone validation failed: {milestone_validation.error}"],
+                        quality_gates_failed=[f"Milestone validation failed: {'; '.join(milestone_validation.errors)}"],
                         recommendations=["Review and complete milestone requirements"],
                         report_file=f"milestone_validation_{milestone_id}_failed.md"
                     )
@@ -1063,60 +1378,46 @@ class MilestoneOrchestrator:
             print(f"      → Committing worktree changes for {milestone_id}...")
         
         try:
-            original_cwd = os.getcwd()
-            os.chdir(worktree_path)
+            # Add all changes; the commit below reports whether anything was staged,
+            # so no separate status probe is needed
+            add_result = _run_git("add", ".", cwd=worktree_path)
             
-            try:
-                # Check if there are any changes to commit
-                status_result = subprocess.run([
-                    "git", "status", "--porcelain"
-                ], capture_output=True, text=True, encoding='utf-8', errors='replace')
-                
-                if not status_result.stdout.strip():
-                    logging.info(f"No changes to commit in worktree {milestone_id}")
-                    return True
-                
-                # Add all changes
-                add_result = subprocess.run([
-                    "git", "add", "."
-                ], capture_output=True, text=True, encoding='utf-8', errors='replace')
-                
-                if add_result.returncode != 0:
-                    logging.error(f"Failed to add changes in worktree {milestone_id}: {add_result.stderr}")
-                    return False
-                
-                # Commit changes
-                commit_message = f"Implement milestone {milestone_id}: {milestone['title']}\n\n"
-                
-                # Add task details to commit message
-                tasks = milestone.get("tasks", [])
-                if tasks:
-                    commit_message += "Tasks completed:\n"
-                    for task in tasks:
-                        commit_message += f"- {task.get('title', task.get('id', 'Unknown task'))}\n"
-                    commit_message += "\n"
-                
-                commit_message += f"Milestone completed as part of automated orchestration.\n\n"
-                commit_message += "🤖 Generated with [Claude Code](https://claude.ai/code)\n\n"
-                commit_message += "Co-Authored-By: Claude <noreply@anthropic.com>"
-                
-                commit_result = subprocess.run([
-                    "git", "commit", "-m", commit_message
-                ], capture_output=True, text=True, encoding='utf-8', errors='replace')
-                
-                if commit_result.returncode == 0:
-                    logging.info(f"Successfully committed worktree {milestone_id}")
-                    if self.verbose:
-                        print(f"      [COMMITTED] {milestone_id}")
-                    return True
-                else:
-                    logging.error(f"Failed to commit worktree {milestone_id}: {commit_result.stderr}")
-                    if self.verbose:
-                        print(f"      [COMMIT_FAIL] {milestone_id}: {commit_result.stderr[:100]}")
-                    return False
-                    
-            finally:
-                os.chdir(original_cwd)
+            if add_result.returncode != 0:
+                logging.error(f"Failed to add changes in worktree {milestone_id}: {add_result.stderr}")
+                return False
+            
+            # Commit changes (message collected in a list, joined once)
+            parts = [f"Implement milestone {milestone_id}: {milestone['title']}\n\n"]
+            
+            # Add task details to commit message
+            tasks = milestone.get("tasks", [])
+            if tasks:
+                parts.append("Tasks completed:\n")
+                parts.extend(f"- {task.get('title', task.get('id', 'Unknown task'))}\n" for task in tasks)
+                parts.append("\n")
+            
+            parts.append(
+                "Milestone completed as part of automated orchestration.\n\n"
+                "🤖 Generated with [Claude Code](https://claude.ai/code)\n\n"
+                "Co-Authored-By: Claude <noreply@anthropic.com>"
+            )
+            commit_message = "".join(parts)
+            
+            commit_result = _run_git("commit", "-m", commit_message, cwd=worktree_path)
+            
+            if commit_result.returncode == 0:
+                logging.info(f"Successfully committed worktree {milestone_id}")
+                if self.verbose:
+                    print(f"      [COMMITTED] {milestone_id}")
+                return True
+            elif _run_git("diff", "--cached", "--quiet", cwd=worktree_path).returncode == 0:
+                logging.info(f"No changes to commit in worktree {milestone_id}")
+                return True
+            else:
+                logging.error(f"Failed to commit worktree {milestone_id}: {commit_result.stderr}")
+                if self.verbose:
+                    print(f"      [COMMIT_FAIL] {milestone_id}: {commit_result.stderr[:100]}")
+                return False
                 
         except Exception as e:
             logging.error(f"Exception during commit of worktree {milestone_id}: {e}")
@@ -1132,35 +1433,35 @@ class MilestoneOrchestrator:
                 for task in tasks
             }
             
-            # Use timeout to allow checking shutdown_requested more frequently
-            while future_to_task and not self.shutdown_requested:
-                try:
-                    for future in as_completed(future_to_task, timeout=1.0):
-                        if self.shutdown_requested:
-                            # Cancel remaining futures
-                            for remaining_future in future_to_task:
-                                remaining_future.cancel()
-                            break
-                        
-                        task = future_to_task.pop(future)
-                        try:
-                            result = future.result()
-                            results.append(result)
-                        except Exception as e:
-                            logging.error(f"Task {task['id']} execution exception: {e}")
-                            results.append(TaskResult(task["id"], False, error=str(e)))
-                        break  # Process one future at a time
-                except TimeoutError:
-                    # Timeout allows us to check shutdown_requested
-                    continue
+            # Wait with a timeout so shutdown_requested is checked regularly; each
+            # pass registers waiters only on the futures that are still pending
+            pending = set(future_to_task)
+            while pending and not self.shutdown_requested:
+                done, pending = wait(pending, timeout=1.0, return_when=FIRST_COMPLETED)
+                for future in done:
+                    task = future_to_task[future]
+                    try:
+                        result = future.result()
+                        results.append(result)
+                    except Exception as e:
+                        logging.error(f"Task {task['id']} execution exception: {e}")
+                        results.append(TaskResult(task["id"], False, error=str(e)))
+            
+            if self.shutdown_requested:
+                # Cancel remaining futures
+                for remaining_future in pending:
+                    remaining_future.cancel()
         
         return results
     
     def execute_single_task(self, task: Dict, milestone_id: str) -> TaskResult:
         """Execute a single task with retries and rate limiting"""
         task_id = task["id"]
-        max_retries = self.config["execution"]["max_retries"]
-        retry_delay = self.config["execution"]["retry_delay"]
+        execution_config = self.config["execution"]
+        max_retries = execution_config["max_retries"]
+        retry_delay = execution_config["retry_delay"]
+        task_timeout = execution_config["task_timeout"]
+        worktree_path = self.state.state["worktree_paths"].get(milestone_id)
         
         for attempt in range(max_retries + 1):
             try:
@@ -1176,7 +1477,8 @@ class MilestoneOrchestrator:
                 if self.config["advanced"]["enable_system_monitoring"]:
                     if not self.system_monitor.check_resources():
                         logging.warning("System resources low, waiting...")
-                        time.sleep(30)
+                        if self._shutdown_event.wait(timeout=30):
+                            return TaskResult(task_id, False, error="Shutdown requested")
                 
                 # Execute task
                 if self.verbose:
@@ -1184,8 +1486,8 @@ class MilestoneOrchestrator:
                 
                 result = self.claude_wrapper.execute_task(
                     task, 
-                    worktree_path=self.state.state["worktree_paths"].get(milestone_id),
-                    timeout=self.config["execution"]["task_timeout"]
+                    worktree_path=worktree_path,
+                    timeout=task_timeout
                 )
                 
                 if self.verbose:
@@ -1197,27 +1499,27 @@ class MilestoneOrchestrator:
                     if task.get('claude_driven') and 'milestone_content' in task:
                         validation_result = self._validate_milestone_implementation(
                             task, 
-                            self.state.state["worktree_paths"].get(milestone_id),
+                            worktree_path,
                             milestone_id
                         )
                         
-                        if not validation_result.success:
-                            logging.warning(f"Milestone validation failed for {task_id}: {validation_result.error}")
+                        if not validation_result.valid:
+                            logging.warning(f"Milestone validation failed for {task_id}: {'; '.join(validation_result.errors)}")
                             if self.verbose:
                                 print(f"      [VALIDATION] Milestone implementation incomplete, retrying...")
                             
                             # Re-execute with gap information
                             gap_result = self._execute_milestone_gap_fix(
                                 task, 
-                                validation_result.error,
-                                self.state.state["worktree_paths"].get(milestone_id)
+                                '; '.join(validation_result.errors),
+                                worktree_path
                             )
                             
                             if gap_result.success:
                                 result = gap_result  # Use the gap-fixed result
                             else:
                                 logging.error(f"Gap fix failed for {task_id}: {gap_result.error}")
-                                result = TaskResult(task_id, False, error=f"Milestone validation failed: {validation_result.error}")
+                                result = TaskResult(task_id, False, error=f"Milestone validation failed: {'; '.join(validation_result.errors)}")
                     
                     if result.success:  # Check again after potential gap fixing
                         self.state.state["completed_tasks"].add(task_id)
@@ -1236,12 +1538,14 @@ class MilestoneOrchestrator:
                     if attempt < max_retries:
                         wait_time = retry_delay * (2 ** attempt)  # Exponential backoff
                         logging.info(f"Retrying task {task_id} in {wait_time}s")
-                        time.sleep(wait_time)
+                        if self._shutdown_event.wait(timeout=wait_time):
+                            return TaskResult(task_id, False, error="Shutdown requested")
             
             except Exception as e:
                 logging.error(f"Task {task_id} exception (attempt {attempt + 1}): {e}")
                 if attempt < max_retries:
-                    time.sleep(retry_delay * (2 ** attempt))
+                    if self._shutdown_event.wait(timeout=retry_delay * (2 ** attempt)):
+                        return TaskResult(task_id, False, error="Shutdown requested")
         
         # All attempts failed
         self.state.state["failed_tasks"].add(task_id)
@@ -1272,31 +1576,24 @@ If implementation is incomplete: "VALIDATION: INCOMPLETE - [specific gaps found]
 Begin validation now."""
 
             # Execute validation in the worktree
-            original_cwd = os.getcwd()
-            if worktree_path and os.path.exists(worktree_path):
-                os.chdir(worktree_path)
+            cwd = worktree_path if worktree_path and os.path.exists(worktree_path) else None
             
-            try:
-                validation_result = self.claude_wrapper._execute_claude_command(validation_prompt, 60, context="validation")
-                output = validation_result.get("output", "").strip()
+            validation_result = self.claude_wrapper._execute_claude_command(validation_prompt, 60, context="validation", cwd=cwd)
+            output = validation_result.get("output", "").strip()
+            
+            if "VALIDATION: COMPLETE" in output:
+                return ValidationResult(True, [], [])
+            else:
+                # Extract gap information
+                gap_info = output
+                if "VALIDATION: INCOMPLETE" in output:
+                    gap_info = output.split("VALIDATION: INCOMPLETE - ", 1)[1] if " - " in output else output
                 
-                if "VALIDATION: COMPLETE" in output:
-                    return ValidationResult(True, "Implementation complete")
-                else:
-                    # Extract gap information
-                    gap_info = output
-                    if "VALIDATION: INCOMPLETE" in output:
-                        gap_info = output.split("VALIDATION: INCOMPLETE - ", 1)[1] if " - " in output else output
-                    
-                    return ValidationResult(False, gap_info)
-                    
-            finally:
-                if worktree_path:
-                    os.chdir(original_cwd)
+                return ValidationResult(False, [gap_info], [])
                     
         except Exception as e:
             logging.error(f"Milestone validation error: {e}")
-            return ValidationResult(False, f"Validation error: {e}")
+            return ValidationResult(False, [f"Validation error: {e}"], [])
     
     def _execute_milestone_gap_fix(self, task: Dict, gap_info: str, worktree_path: str) -> 'TaskResult':
         """Execute milestone implementation to fix identified gaps"""
@@ -1324,22 +1621,15 @@ INSTRUCTIONS:
 Begin gap fixing now."""
 
             # Execute gap fixing
-            original_cwd = os.getcwd()
-            if worktree_path and os.path.exists(worktree_path):
-                os.chdir(worktree_path)
-                
-            try:
-                result = self.claude_wrapper._execute_claude_command(gap_prompt, 300, context="gap_fix")
-                success = self.claude_wrapper._analyze_result(result, task)
-                
-                if success:
-                    return TaskResult(task["id"], True, output=result.get("output", ""), duration=0)
-                else:
-                    return TaskResult(task["id"], False, error=result.get("error", "Gap fix failed"))
-                    
-            finally:
-                if worktree_path:
-                    os.chdir(original_cwd)
+            cwd = worktree_path if worktree_path and os.path.exists(worktree_path) else None
+            
+            result = self.claude_wrapper._execute_claude_command(gap_prompt, 300, context="gap_fix", cwd=cwd)
+            success = self.claude_wrapper._analyze_result(result, task)
+            
+            if success:
+                return TaskResult(task["id"], True, output=result.get("output", ""), duration=0)
+            else:
+                return TaskResult(task["id"], False, error=result.get("error", "Gap fix failed"))
                     
         except Exception as e:
             logging.error(f"Gap fixing error: {e}")
@@ -1351,7 +1641,7 @@ Begin gap fixing now."""
             # Get milestone filepath to read raw content
             milestone_filepath = milestone.get('filepath', '')
             if not milestone_filepath or not os.path.exists(milestone_filepath):
-                return ValidationResult(False, "Milestone file not found")
+                return ValidationResult(False, ["Milestone file not found"], [])
             
             # Read milestone content
             milestone_content = Path(milestone_filepath).read_text(encoding='utf-8')
@@ -1377,31 +1667,24 @@ If validation fails: "MILESTONE_VALIDATION: INCOMPLETE - [detailed description o
 Begin comprehensive validation now."""
 
             # Execute validation in the worktree
-            original_cwd = os.getcwd()
-            if worktree_path and os.path.exists(worktree_path):
-                os.chdir(worktree_path)
+            cwd = worktree_path if worktree_path and os.path.exists(worktree_path) else None
             
-            try:
-                validation_result = self.claude_wrapper._execute_claude_command(validation_prompt, 120, context="validation")
-                output = validation_result.get("output", "").strip()
+            validation_result = self.claude_wrapper._execute_claude_command(validation_prompt, 120, context="validation", cwd=cwd)
+            output = validation_result.get("output", "").strip()
+            
+            if "MILESTONE_VALIDATION: COMPLETE" in output:
+                return ValidationResult(True, [], [])
+            else:
+                # Extract gap information
+                gap_info = output
+                if "MILESTONE_VALIDATION: INCOMPLETE" in output:
+                    gap_info = output.split("MILESTONE_VALIDATION: INCOMPLETE - ", 1)[1] if " - " in output else output
                 
-                if "MILESTONE_VALIDATION: COMPLETE" in output:
-                    return ValidationResult(True, "Milestone validation passed")
-                else:
-                    # Extract gap information
-                    gap_info = output
-                    if "MILESTONE_VALIDATION: INCOMPLETE" in output:
-                        gap_info = output.split("MILESTONE_VALIDATION: INCOMPLETE - ", 1)[1] if " - " in output else output
-                    
-                    return ValidationResult(False, gap_info)
-                    
-            finally:
-                if worktree_path:
-                    os.chdir(original_cwd)
+                return ValidationResult(False, [gap_info], [])
                     
         except Exception as e:
             logging.error(f"Pre-review validation error: {e}")
-            return ValidationResult(False, f"Pre-review validation error: {e}")
+            return ValidationResult(False, [f"Pre-review validation error: {e}"], [])
     
     def _execute_stage_milestone_gap_fix(self, milestone_id: str, gap_info: str, worktree_path: str) -> bool:
         """Execute gap fixing for milestone during code review stage"""
@@ -1450,17 +1733,14 @@ INSTRUCTIONS:
 Begin comprehensive gap fixing now."""
 
             # Execute gap fixing
-            original_cwd = os.getcwd()
-            if worktree_path and os.path.exists(worktree_path):
-                os.chdir(worktree_path)
-                
-            try:
-                result = self.claude_wrapper._execute_claude_command(gap_prompt, 600, context="gap_fix")  # Longer timeout for comprehensive fix
-                return result.get("success", True)  # Assume success if no error
-                    
-            finally:
-                if worktree_path:
-                    os.chdir(original_cwd)
+            cwd = worktree_path if worktree_path and os.path.exists(worktree_path) else None
+            
+            result = self.claude_wrapper._execute_claude_command(gap_prompt, 600, context="gap_fix", cwd=cwd)  # Longer timeout for comprehensive fix
+            # _execute_claude_command returns a dict without a "success" key
+            if result["returncode"] != 0:
+                logging.warning(f"Stage gap fix for {milestone_id} failed: {result['error'][:200]}")
+                return False
+            return True
                     
         except Exception as e:
             logging.error(f"Stage gap fixing error: {e}")
@@ -1468,8 +1748,7 @@ Begin comprehensive gap fixing now."""
     
     def _extract_stage_from_milestone_id(self, milestone_id: str) -> int:
         """Extract stage number from milestone ID"""
-        import re
-        match = re.search(r'^(\d+)[a-z]', milestone_id)
+        match = _STAGE_WITH_SUFFIX_RE.match(milestone_id)
         return int(match.group(1)) if match else 1
     
     def _get_milestone_filepath(self, milestone_id: str) -> str:
@@ -1517,17 +1796,8 @@ Begin comprehensive gap fixing now."""
             return success_rate >= 0.8  # Fallback to success rate
     
     def update_tasks_file(self, milestone: Dict, task_results: List[TaskResult]):
-        """Update TASKS.md file with milestone completion"""
+        """Queue a milestone completion entry for TASKS.md on the background writer"""
         try:
-            tasks_file = Path(self.config["tasks_file"])
-            
-            # Read existing content
-            if tasks_file.exists():
-                content = tasks_file.read_text(encoding='utf-8')
-            else:
-                content = "# Task Progress\n\n"
-            
-            # Add milestone completion entry
             timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             successful_tasks = sum(1 for r in task_results if r.success)
             total_tasks = len(task_results)
@@ -1541,15 +1811,55 @@ Begin comprehensive gap fixing now."""
             else:
                 entry += "**Status:** [PARTIAL] PARTIALLY COMPLETED\n\n"
             
-            # Update file
-            content += entry
-            tasks_file.write_text(content, encoding='utf-8')
-            
-            logging.info(f"Updated {tasks_file} with milestone {milestone['id']} completion")
-            
+            with self._tasks_file_lock:
+                if self._tasks_file_writer is None:
+                    self._tasks_file_writer = threading.Thread(target=self._tasks_file_writer_loop,
+                                                               name="orch-tasks-file", daemon=True)
+                    self._tasks_file_writer.start()
+            self._tasks_file_queue.put((milestone['id'], entry))
         except Exception as e:
             logging.error(f"Failed to update tasks file: {e}")
     
+    def _tasks_file_writer_loop(self):
+        """Append queued TASKS.md entries in batches, at most once per flush interval"""
+        tasks_file = Path(self.config["tasks_file"])
+        stopping = False
+        while not stopping:
+            batch = [self._tasks_file_queue.get()]
+            while len(batch) < _TASKS_FILE_BATCH_SIZE:
+                try:
+                    batch.append(self._tasks_file_queue.get_nowait())
+                except queue.Empty:
+                    break
+            if None in batch:
+                stopping = True
+                batch = [item for item in batch if item is not None]
+            if not batch:
+                continue
+            
+            try:
+                # Append instead of re-reading and rewriting the whole file
+                needs_header = not tasks_file.exists() or tasks_file.stat().st_size == 0
+                with open(tasks_file, 'a', encoding='utf-8') as f:
+                    if needs_header:
+                        f.write("# Task Progress\n\n")
+                    f.write("".join(entry for _, entry in batch))
+                for milestone_id, _ in batch:
+                    logging.info(f"Updated {tasks_file} with milestone {milestone_id} completion")
+            except Exception as e:
+                logging.error(f"Failed to update tasks file: {e}")
+            
+            if not stopping:
+                time.sleep(_TASKS_FILE_FLUSH_INTERVAL)
+    
+    def _stop_tasks_file_writer(self):
+        """Flush pending TASKS.md entries and stop the background writer"""
+        with self._tasks_file_lock:
+            writer, self._tasks_file_writer = self._tasks_file_writer, None
+        if writer is not None:
+            self._tasks_file_queue.put(None)
+            writer.join()
+    
     def generate_final_report(self):
         """Generate comprehensive execution report"""
         try:
@@ -1563,7 +1873,7 @@ Begin comprehensive gap fixing now."""
                     "skipped_tasks": len(self.state.state["skipped_tasks"])
                 },
                 "stage_results": self.state.state.get("stage_results", {}),
-                "execution_log": self.state.state.get("execution_log", [])
+                "execution_log": self.state.read_execution_log(limit=_EXECUTION_LOG_MAXLEN)
             }
             
             with open(".orchestrator/execution_report.json", "w") as f:
@@ -1586,12 +1896,16 @@ Begin comprehensive gap fixing now."""
                     except Exception as e:
                         logging.warning(f"Failed to cleanup worktree {worktree_path}: {e}")
             
-            # Shutdown executor
+            # Shutdown executors
             if hasattr(self, 'executor'):
                 self.executor.shutdown(wait=True)
             
-            # Save final state
+            # Flush pending TASKS.md entries
+            self._stop_tasks_file_writer()
+            
+            # Save final state and flush the log journal
             self.state.save_state()
+            self.state.close_journal()
             
             logging.info("Cleanup completed")
             
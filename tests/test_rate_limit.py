@@ -0,0 +1,83 @@
+"""Tests for the token-bucket RateLimitManager"""
+
+from claude_orchestrator import advanced
+from claude_orchestrator.advanced import RateLimitManager
+
+_STATS_KEYS = {
+    "requests_last_minute",
+    "burst_count",
+    "tokens_available",
+    "burst_tokens_available",
+    "adjustment_factor",
+    "consecutive_429s",
+    "effective_rate",
+    "tracked_keys",
+}
+
+
+def _rewind(manager, seconds, key=None):
+    """Pretend the shard was last refilled `seconds` ago"""
+    manager._get_shard(key).last_refill -= int(seconds * advanced._NS_PER_SECOND)
+
+
+def test_get_stats_keys():
+    manager = RateLimitManager(requests_per_minute=60, burst_limit=5)
+    assert set(manager.get_stats()) == _STATS_KEYS
+    assert set(manager.get_stats("other")) == _STATS_KEYS
+
+
+def test_fresh_limiter_reports_no_usage():
+    stats = RateLimitManager(requests_per_minute=60, burst_limit=5).get_stats()
+    assert stats["requests_last_minute"] == 0
+    assert stats["burst_count"] == 0
+    assert stats["effective_rate"] == 60
+    assert stats["tracked_keys"] == 1
+
+
+def test_requests_within_burst_do_not_wait():
+    manager = RateLimitManager(requests_per_minute=60, burst_limit=5)
+    for _ in range(5):
+        assert manager.wait_if_needed() == 0
+    stats = manager.get_stats()
+    assert stats["burst_count"] == 5
+    assert stats["requests_last_minute"] == 5
+    assert stats["burst_tokens_available"] < 1
+
+
+def test_buckets_refill_with_elapsed_time():
+    manager = RateLimitManager(requests_per_minute=60, burst_limit=6)
+    for _ in range(6):
+        manager.wait_if_needed()
+    # The burst bucket refills its capacity once per minute: 6 tokens/min is one per 10s
+    _rewind(manager, 10)
+    stats = manager.get_stats()
+    assert 1 <= stats["burst_tokens_available"] < 2
+    assert stats["burst_count"] == 5
+    assert manager.wait_if_needed() == 0
+
+
+def test_refill_is_capped_at_capacity():
+    manager = RateLimitManager(requests_per_minute=60, burst_limit=5)
+    manager.wait_if_needed()
+    _rewind(manager, 3600)
+    stats = manager.get_stats()
+    assert stats["tokens_available"] == 60
+    assert stats["burst_tokens_available"] == 5
+
+
+def test_get_stats_does_not_consume_or_refill():
+    manager = RateLimitManager(requests_per_minute=60, burst_limit=5)
+    manager.wait_if_needed()
+    shard = manager._get_shard(None)
+    before = (shard.tokens, shard.burst_tokens, shard.last_refill)
+    manager.get_stats()
+    assert (shard.tokens, shard.burst_tokens, shard.last_refill) == before
+
+
+def test_keys_have_independent_buckets():
+    manager = RateLimitManager(requests_per_minute=60, burst_limit=2)
+    manager.wait_if_needed("a")
+    manager.wait_if_needed("a")
+    assert manager.get_stats("a")["burst_count"] == 2
+    assert manager.get_stats("b")["burst_count"] == 0
+    assert manager.get_stats()["tracked_keys"] == 3
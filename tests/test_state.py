@@ -0,0 +1,171 @@
+"""Tests for OrchestratorState persistence and the execution log journal"""
+
+import json
+import os
+
+import pytest
+
+from claude_orchestrator import orchestrator
+from claude_orchestrator.orchestrator import OrchestratorState, _dump_state_bytes, _load_state_bytes
+
+
+def _state_path(tmp_path, ext):
+    state_dir = tmp_path / ".orchestrator"
+    state_dir.mkdir(exist_ok=True)
+    return str(state_dir / f"orchestrator_state{ext}")
+
+
+def _populate(state):
+    state.state["current_stage"] = 2
+    state.state["completed_tasks"].update({"1-b", "1-a"})
+    state.state["failed_tasks"].add("2-a")
+    state.state["stage_results"][1] = {"success": True, "tasks": ("1-a", "1-b")}
+    state.state["execution_log"].append("carried over")
+
+
+@pytest.mark.parametrize("ext", [".msgpack", ".json"])
+def test_state_round_trip(tmp_path, ext):
+    path = _state_path(tmp_path, ext)
+    state = OrchestratorState(path)
+    _populate(state)
+    state.save_state()
+
+    loaded = OrchestratorState(path).state
+    assert loaded["current_stage"] == 2
+    assert loaded["completed_tasks"] == {"1-a", "1-b"}
+    assert loaded["failed_tasks"] == {"2-a"}
+    # Keys are normalized to strings and tuples to lists
+    assert loaded["stage_results"] == {"1": {"success": True, "tasks": ["1-a", "1-b"]}}
+    assert list(loaded["execution_log"]) == ["carried over"]
+
+
+def test_json_round_trip_without_orjson(tmp_path, monkeypatch):
+    monkeypatch.setattr(orchestrator, "orjson", None)
+    path = _state_path(tmp_path, ".json")
+    state = OrchestratorState(path)
+    _populate(state)
+    state.save_state()
+
+    with open(path, encoding="utf-8") as f:
+        assert json.load(f)["completed_tasks"] == ["1-a", "1-b"]
+    assert OrchestratorState(path).state["completed_tasks"] == {"1-a", "1-b"}
+
+
+def test_backends_store_the_same_data(tmp_path):
+    state = OrchestratorState(_state_path(tmp_path, ".msgpack"))
+    _populate(state)
+    from_msgpack = _load_state_bytes(_dump_state_bytes(state.state, "s.msgpack"), "s.msgpack")
+    from_json = _load_state_bytes(_dump_state_bytes(state.state, "s.json"), "s.json")
+    assert from_msgpack == from_json
+
+
+def test_unchanged_state_is_not_rewritten(tmp_path):
+    path = _state_path(tmp_path, ".json")
+    state = OrchestratorState(path)
+    _populate(state)
+    state.save_state()
+    os.utime(path, (0, 0))
+    state.save_state()
+    assert os.path.getmtime(path) == 0
+
+
+def test_json_state_is_migrated_to_msgpack(tmp_path):
+    json_path = _state_path(tmp_path, ".json")
+    legacy = OrchestratorState(json_path)
+    _populate(legacy)
+    legacy.save_state()
+
+    msgpack_path = _state_path(tmp_path, ".msgpack")
+    state = OrchestratorState(msgpack_path)
+    assert state.state["completed_tasks"] == {"1-a", "1-b"}
+    state.save_state()
+    assert os.path.exists(msgpack_path)
+    assert not os.path.exists(json_path)
+    assert OrchestratorState(msgpack_path).state["current_stage"] == 2
+
+
+def test_newest_state_file_wins(tmp_path):
+    msgpack_path = _state_path(tmp_path, ".msgpack")
+    old = OrchestratorState(msgpack_path)
+    old.state["current_stage"] = 1
+    old.save_state()
+    os.utime(msgpack_path, (1, 1))
+
+    json_path = _state_path(tmp_path, ".json")
+    new = OrchestratorState(json_path)
+    new.state["current_stage"] = 3
+    new.save_state()
+
+    assert OrchestratorState(msgpack_path).state["current_stage"] == 3
+
+
+def test_msgpack_state_ignored_without_msgpack(tmp_path, monkeypatch):
+    msgpack_path = _state_path(tmp_path, ".msgpack")
+    state = OrchestratorState(msgpack_path)
+    state.state["current_stage"] = 4
+    state.save_state()
+
+    monkeypatch.setattr(orchestrator, "msgpack", None)
+    fallback = OrchestratorState(_state_path(tmp_path, ".json"))
+    assert fallback.state["current_stage"] == 0
+    # The unreadable file is left in place for when msgpack is installed again
+    fallback.save_state()
+    assert os.path.exists(msgpack_path)
+
+
+def test_execution_log_round_trip(tmp_path):
+    state = OrchestratorState(_state_path(tmp_path, ".json"))
+    state.state["execution_log"].append("[old] carried over")
+    state.add_log_entry("first")
+    state.add_log_entry("second")
+    state.close_journal()
+
+    entries = state.read_execution_log()
+    assert entries[0] == "[old] carried over"
+    assert [entry.split("] ", 1)[1] for entry in entries[1:]] == ["first", "second"]
+    assert len(state.read_execution_log(limit=1)) == 1
+
+
+def test_corrupt_journal_lines_are_skipped(tmp_path):
+    state = OrchestratorState(_state_path(tmp_path, ".json"))
+    state.add_log_entry("first")
+    state.close_journal()
+    with open(state.journal_file, "a", encoding="utf-8") as f:
+        f.write("not json\n")
+        f.write('{"msg": "no timestamp"}\n')
+        # Truncated write left behind by a crash
+        f.write('{"ts": "2024-01-01T00:00:00", "msg": "trun')
+
+    entries = state.read_execution_log()
+    assert len(entries) == 1
+    assert entries[0].endswith("] first")
+
+
+def test_journal_append_after_partial_line(tmp_path):
+    path = _state_path(tmp_path, ".json")
+    state = OrchestratorState(path)
+    state.add_log_entry("first")
+    state.close_journal()
+    with open(state.journal_file, "a", encoding="utf-8") as f:
+        f.write('{"ts": "2024-01-01T00:00:00", "msg": "trun')
+
+    resumed = OrchestratorState(path)
+    resumed.add_log_entry("second")
+    resumed.close_journal()
+    assert [entry.split("] ", 1)[1] for entry in resumed.read_execution_log()] == ["first", "second"]
+
+
+def test_oversized_journal_is_rotated(tmp_path, monkeypatch):
+    monkeypatch.setattr(orchestrator, "_JOURNAL_MAX_BYTES", 10)
+    state = OrchestratorState(_state_path(tmp_path, ".json"))
+    state.add_log_entry("first")
+    state.close_journal()
+    state.add_log_entry("second")
+    state.close_journal()
+
+    assert os.path.exists(state.journal_file + ".1")
+    assert [entry.split("] ", 1)[1] for entry in state.read_execution_log()] == ["second"]
+
+    state.reset_state()
+    assert not os.path.exists(state.journal_file)
+    assert not os.path.exists(state.journal_file + ".1")
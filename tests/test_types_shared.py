@@ -0,0 +1,30 @@
+"""Tests for the shared result types"""
+
+from claude_orchestrator.types_shared import ValidationResult
+
+
+def test_counts_follow_initial_messages():
+    result = ValidationResult(False, ["a", "b"], ["c"])
+    assert result.error_count == 2
+    assert result.warning_count == 1
+
+
+def test_add_error_and_warning():
+    result = ValidationResult(True, [], [])
+    result.add_warning("w")
+    assert result.valid
+    result.add_error("e")
+    assert not result.valid
+    assert (result.error_count, result.warning_count) == (1, 1)
+    assert list(result.iter_messages()) == ["e", "w"]
+
+
+def test_count_only_keeps_no_messages():
+    result = ValidationResult.count_only()
+    result.add_error("e1")
+    result.add_error("e2")
+    result.add_warning("w")
+    assert not result.valid
+    assert (result.error_count, result.warning_count) == (2, 1)
+    assert result.errors is None and result.warnings is None
+    assert list(result.iter_messages()) == []
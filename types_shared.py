@@ -4,24 +4,55 @@ Shared Types Module for Claude Code Orchestrator
 Contains common data types to avoid circular imports.
 """
 
-from dataclasses import dataclass
+import sys
+import time
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List
+from functools import cached_property
+from typing import Any, Dict, Iterator, List, Optional
 
-@dataclass
+# dataclass(slots=True) is only available on Python 3.10+
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+@dataclass(**_DATACLASS_SLOTS)
 class ValidationResult:
     """Result of milestone or task validation"""
     valid: bool
-    errors: List[str]
-    warnings: List[str]
+    errors: Optional[List[str]]  # None on count-only results
+    warnings: Optional[List[str]]
     score: float = 0.0
+    error_count: int = field(default=0, init=False)
+    warning_count: int = field(default=0, init=False)
+    
+    def __post_init__(self):
+        if self.errors:
+            self.error_count = len(self.errors)
+        if self.warnings:
+            self.warning_count = len(self.warnings)
+    
+    @classmethod
+    def count_only(cls) -> 'ValidationResult':
+        """Result that tallies findings without storing their messages"""
+        return cls(True, None, None)
     
     def add_error(self, error: str):
-        self.errors.append(error)
-        self.valid = False
+        self.error_count += 1
+        if self.errors is not None:
+            self.errors.append(error)
+        if self.valid:
+            self.valid = False
     
     def add_warning(self, warning: str):
-        self.warnings.append(warning)
+        self.warning_count += 1
+        if self.warnings is not None:
+            self.warnings.append(warning)
+    
+    def iter_messages(self) -> Iterator[str]:
+        """Yield stored errors followed by warnings"""
+        if self.errors:
+            yield from self.errors
+        if self.warnings:
+            yield from self.warnings
 
 @dataclass
 class CodeReviewResult:
@@ -34,10 +65,51 @@ class CodeReviewResult:
     report_file: str
     iterations_completed: int = 0
     
-    @property
+    @cached_property
     def has_quality_issues(self) -> bool:
+        # Cached on first access; findings are not modified after parsing
         return len(self.todos_found) > 0 or len(self.quality_gates_failed) > 0 or self.quality_score < 0.8
 
+@dataclass(frozen=True)
+class SystemStats:
+    """Immutable snapshot of system resource usage"""
+    cpu_percent: float = 0.0
+    memory_percent: float = 0.0
+    disk_percent: float = 0.0
+    bytes_sent: int = 0
+    bytes_recv: int = 0
+    net_tx_bps: float = 0.0  # bytes/s since the previous sample
+    net_rx_bps: float = 0.0
+    last_update: int = 0  # time.monotonic_ns() when the sample was taken
+    
+    def to_dict(self) -> Dict[str, Any]:
+        # Same shape as the dict SystemMonitor.get_stats has always returned,
+        # with last_update as a wall-clock timestamp, plus the throughput fields
+        age = (time.monotonic_ns() - self.last_update) / 1_000_000_000
+        return {
+            "cpu_percent": self.cpu_percent,
+            "memory_percent": self.memory_percent,
+            "disk_percent": self.disk_percent,
+            "network_io": {"bytes_sent": self.bytes_sent, "bytes_recv": self.bytes_recv},
+            "net_tx_bps": self.net_tx_bps,
+            "net_rx_bps": self.net_rx_bps,
+            "last_update": time.time() - age
+        }
+
+@dataclass(**_DATACLASS_SLOTS)
+class WorktreeInfo:
+    """Bookkeeping for an active git worktree"""
+    path: str
+    branch: str
+    created: float  # time.time() at creation
+    
+    def to_dict(self) -> Dict[str, str]:
+        return {
+            "path": self.path,
+            "branch": self.branch,
+            "created": datetime.fromtimestamp(self.created).isoformat()
+        }
+
 class TaskResult:
     """Represents the result of a task execution"""
     